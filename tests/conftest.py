@@ -1,10 +1,36 @@
+from collections.abc import AsyncIterator
+
 import pytest
+import uvloop
 from fakeredis import FakeAsyncRedis
 from tests.fixtures import *
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    """Run the async tests on uvloop."""
+
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def redis_mock() -> FakeAsyncRedis:
+    """Create a mock Redis client shared by the test session."""
+
+    return FakeAsyncRedis(decode_responses=False)
+
+
 @pytest.fixture(autouse=True, scope="function")
-async def redis_mock() -> FakeAsyncRedis:
-    """Create a mock Redis client."""
+async def flush_redis_mock(request: pytest.FixtureRequest) -> AsyncIterator[None]:
+    """Give each test that uses the mock Redis client an empty database."""
+
+    if "redis_mock" not in request.fixturenames:
+        yield
+
+        return
+
+    redis_mock: FakeAsyncRedis = request.getfixturevalue("redis_mock")
+
+    yield
 
-    return FakeAsyncRedis(decode_responses=True)
+    await redis_mock.flushdb()
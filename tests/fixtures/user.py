@@ -14,9 +14,9 @@ class UserFixture(RedisModel):
     name: str
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session")
 def user_class(redis_mock: FakeAsyncRedis) -> type[UserFixture]:
-    """Create a User with a mock Redis client."""
+    """Create a User with a mock Redis client, once per test session."""
 
     class User(
         Store(redis_mock), UserFixture, model_name="user"
@@ -1,7 +1,9 @@
-from typing import Annotated
+from datetime import datetime
+from enum import Enum
+from typing import Annotated, Optional
 
 import pytest
-from pydantic import ValidationError
+from pydantic import ConfigDict, Field, ValidationError, field_validator
 from fakeredis import FakeAsyncRedis
 from tests.fixtures import UserFixture
 from typed_redis import RedisPrimaryKey, RedisModel, Store
@@ -23,7 +25,7 @@ async def _assert_valid_user(user: UserFixture, redis_mock: FakeAsyncRedis):
     assert user._client == redis_mock
     assert user._redis_key == f"user:{user.id}"
 
-    assert await redis_mock.get(user._redis_key) == user.model_dump_json()
+    assert await redis_mock.get(user._redis_key) == user.model_dump_json().encode()
 
 
 class TestModelCreation:
@@ -69,6 +71,14 @@ class TestModelCreation:
 
         assert ttl is not None and 0 < ttl <= 60
 
+    def test_json_codecs_round_trip(self, user_class: type[UserFixture]):
+        """The model's JSON codecs should match model_dump_json and round-trip the model."""
+
+        user = user_class(id=6, name="Codec")
+
+        assert user._dump_json().decode() == user.model_dump_json()
+        assert user_class._load_json(user.model_dump_json()) == user
+
 
 class TestModelValidation:
     """Group validation-related Redis model tests."""
@@ -91,13 +101,168 @@ class TestModelValidation:
         await user.update(name="After")
 
         # persisted
-        assert await redis_mock.get(user._redis_key) == user.model_dump_json()
+        assert await redis_mock.get(user._redis_key) == user.model_dump_json().encode()
         assert user.name == "After"
 
         # invalid update
         with pytest.raises(ValidationError):
             await user.update(name=True)  # type: ignore[arg-type]
 
+    @pytest.mark.asyncio
+    async def test_update_keeps_ttl(self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis):
+        """Update should not clear a TTL set on create."""
+
+        user = user_class(id=11, name="Expiring")
+
+        await user.create(ex=60)
+        await user.update(name="Still Expiring")
+
+        ttl = await redis_mock.ttl(user._redis_key)
+
+        assert 0 < ttl <= 60
+
+    @pytest.mark.asyncio
+    async def test_update_coerces_values_and_rejects_unknown_fields(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Update should store validated values and reject fields the model does not define."""
+
+        user = await _create_user(user_class, idx=9, name="Coerce")
+
+        await user.update(id="10")
+
+        assert user.id == 10
+        await _assert_valid_user(user, redis_mock)
+
+        with pytest.raises(ValueError):
+            await user.update(nickname="Nope")
+
+        assert await redis_mock.get(user._redis_key) == user.model_dump_json().encode()
+
+    @pytest.mark.asyncio
+    async def test_assigning_primary_key_writes_new_redis_key(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Assigning the primary key directly should persist under the new Redis key."""
+
+        user = await _create_user(user_class, idx=12, name="Assigned")
+
+        user.id = 13
+
+        await user.create()
+
+        await _assert_valid_user(user, redis_mock)
+        assert user == user_class(id=13, name="Assigned")
+
+    @pytest.mark.asyncio
+    async def test_model_copy_uses_copied_primary_key(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """A copy with a new primary key should not overwrite the original's record."""
+
+        original = await _create_user(user_class, idx=14, name="Original")
+        copy = original.model_copy(update={"id": 15, "name": "Copy"})
+
+        assert copy._redis_key == "user:15"
+
+        await copy.create()
+
+        await _assert_valid_user(original, redis_mock)
+        await _assert_valid_user(copy, redis_mock)
+
+    @pytest.mark.asyncio
+    async def test_update_does_not_revalidate_unchanged_fields(self, redis_mock: FakeAsyncRedis):
+        """Update should keep unchanged fields as they are, even with non-idempotent validators."""
+
+        class Shout(Store(redis_mock), RedisModel, model_name="shout"):
+            id: Annotated[int, RedisPrimaryKey]
+            name: str
+            count: int = 0
+
+            @field_validator("name")
+            @classmethod
+            def add_exclamation(cls, value: str) -> str:
+                """Append an exclamation mark."""
+
+                return value + "!"
+
+        shout = Shout(id=1, name="a")
+
+        await shout.update(count=1)
+        await shout.update(count=2)
+
+        assert shout.name == "a!"
+        assert await redis_mock.get("shout:1") == shout.model_dump_json().encode()
+
+        await shout.update(name="b")
+
+        assert shout.name == "b!"
+
+    @pytest.mark.asyncio
+    async def test_update_extra_fields(self, redis_mock: FakeAsyncRedis):
+        """Update should set extra fields on models that allow them."""
+
+        class Loose(Store(redis_mock), RedisModel, model_name="loose"):
+            model_config = ConfigDict(extra="allow")
+
+            id: Annotated[int, RedisPrimaryKey]
+
+        loose = Loose(id=1, kept="yes")
+
+        await loose.update(added="new")
+
+        assert loose.__pydantic_extra__ == {"kept": "yes", "added": "new"}
+
+    @pytest.mark.asyncio
+    async def test_update_rejects_frozen_models_and_fields(self, redis_mock: FakeAsyncRedis):
+        """Update should raise ValidationError for frozen models and frozen fields without persisting."""
+
+        class FrozenModel(Store(redis_mock), RedisModel, model_name="frozenmodel"):
+            model_config = ConfigDict(frozen=True)
+
+            id: Annotated[int, RedisPrimaryKey]
+            name: str
+
+        class FrozenField(Store(redis_mock), RedisModel, model_name="frozenfield"):
+            id: Annotated[int, RedisPrimaryKey]
+            name: str = Field(frozen=True)
+            nickname: str
+
+        frozen_model = FrozenModel(id=1, name="Before")
+        frozen_field = FrozenField(id=1, name="Before", nickname="Before")
+
+        await frozen_model.create()
+        await frozen_field.create()
+
+        with pytest.raises(ValidationError, match="frozen_instance"):
+            await frozen_model.update(name="After")
+
+        with pytest.raises(ValidationError, match="frozen_field"):
+            await frozen_field.update(name="After", nickname="After")
+
+        assert frozen_model.name == "Before"
+        assert frozen_field.nickname == "Before"
+        assert await FrozenModel.get(1) == frozen_model
+        assert await FrozenField.get(1) == frozen_field
+
+        await frozen_field.update(nickname="After")
+
+        assert (await FrozenField.get(1)).nickname == "After"
+
+    @pytest.mark.asyncio
+    async def test_update_primary_key_refreshes_redis_key(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Updating the primary key should persist under the new Redis key."""
+
+        user = await _create_user(user_class, idx=7, name="Moved")
+
+        assert user._redis_key == "user:7"
+
+        await user.update(id=8)
+
+        await _assert_valid_user(user, redis_mock)
+
 
 class TestModelGet:
     """Group get-related Redis model tests."""
@@ -117,7 +282,17 @@ class TestModelGet:
         assert await user_class.get(4) == user
 
         # persisted model is the same as the one returned by get
-        assert await redis_mock.get(user._redis_key) == user.model_dump_json()
+        assert await redis_mock.get(user._redis_key) == user.model_dump_json().encode()
+
+    @pytest.mark.asyncio
+    async def test_redis_model_get_many(self, user_class: type[UserFixture]):
+        """Get many should return models in order with None for missing keys."""
+
+        first = await _create_user(user_class, idx=1, name="First")
+        second = await _create_user(user_class, idx=2, name="Second")
+
+        assert await user_class.get_many([2, 3, 1]) == [second, None, first]
+        assert await user_class.get_many([]) == []
 
 
 class TestModelDeletion:
@@ -167,65 +342,75 @@ class TestModelUnbound:
             _ = obj._client
 
         # Async operations should also raise
-        operations: list[tuple[str, bool]] = [
-            ("create", False),  # instance method
-            ("get", True),  # class method
-        ]
-
-        for method_name, is_classmethod in operations:
-            with pytest.raises(RuntimeError):
-                if is_classmethod:
-                    method = getattr(Unbound, method_name)
+        with pytest.raises(RuntimeError):
+            await Unbound(id=1).create()
 
-                    await method(1)
-                else:
-                    instance = Unbound(id=1)
-                    method = getattr(instance, method_name)
+        with pytest.raises(RuntimeError):
+            await Unbound.get(1)
 
-                    await method()
+        with pytest.raises(RuntimeError):
+            await Unbound.get_many([1])
 
 
 class TestModelPrimaryKeyAnnotations:
     """Group primary-key annotation Redis model tests."""
 
     def test_missing_primary_key_annotation_raises(self, redis_mock: FakeAsyncRedis):
-        """Model without a primary key annotation should raise ValueError when key is needed."""
+        """Model without a primary key annotation should raise ValueError when the class is created."""
 
-        class NoPk(Store(redis_mock), RedisModel, model_name="nopk"):
-            id: int
+        with pytest.raises(ValueError):
 
-        obj = NoPk(id=1)
+            class NoPk(Store(redis_mock), RedisModel, model_name="nopk"):
+                id: int
+
+    def test_multiple_primary_key_annotations_raise(self, redis_mock: FakeAsyncRedis):
+        """Model with multiple primary keys should raise ValueError when the class is created."""
 
         with pytest.raises(ValueError):
-            _ = obj._redis_key
 
-    def test_multiple_primary_key_annotations_raise(self, redis_mock: FakeAsyncRedis):
-        """Model with multiple primary keys should raise ValueError when key is computed."""
+            class MultiPk(Store(redis_mock), RedisModel, model_name="mpk"):
+                id: Annotated[int, RedisPrimaryKey]
+                other: Annotated[int, RedisPrimaryKey]
 
-        class MultiPk(Store(redis_mock), RedisModel, model_name="mpk"):
-            id: Annotated[int, RedisPrimaryKey]
-            other: Annotated[int, RedisPrimaryKey]
+    def test_optional_primary_key_annotation(self, redis_mock: FakeAsyncRedis):
+        """A primary key annotated inside Optional or a union should still be found."""
 
-        obj = MultiPk(id=1, other=2)
+        class OptionalPk(Store(redis_mock), RedisModel, model_name="optpk"):
+            id: Optional[Annotated[int, RedisPrimaryKey]]
 
-        with pytest.raises(ValueError):
-            _ = obj._redis_key
+        class UnionPk(Store(redis_mock), RedisModel, model_name="unionpk"):
+            id: Annotated[int, RedisPrimaryKey] | str
+
+        assert OptionalPk(id=1)._redis_key == "optpk:1"
+        assert UnionPk(id="a")._redis_key == "unionpk:a"
+
+    def test_base_without_model_name_may_omit_primary_key(self, redis_mock: FakeAsyncRedis):
+        """Intermediate bases without a model_name should not require a primary key."""
+
+        class Base(Store(redis_mock), RedisModel):
+            created_by: str
+
+        class Child(Base, model_name="child"):
+            id: Annotated[int, RedisPrimaryKey]
+
+        assert Child._primary_key_field_name == "id"
+        assert Child._key_prefix == "child:"
 
 
 class TestModelDecoding:
     """Group response-decoding Redis model tests."""
 
     @pytest.mark.asyncio
-    async def test_get_decodes_bytes_when_decode_responses_false(self):
-        """Ensure bytes returned from Redis are decoded before model parsing."""
+    async def test_get_parses_str_when_decode_responses_true(self):
+        """Ensure str returned from Redis is parsed into the model."""
 
-        rbytes = FakeAsyncRedis(decode_responses=False)
+        rstr = FakeAsyncRedis(decode_responses=True)
 
-        class Foo(Store(rbytes), RedisModel, model_name="foo"):
+        class Foo(Store(rstr), RedisModel, model_name="foo"):
             id: Annotated[int, RedisPrimaryKey]
             name: str
 
-        original = Foo(id=10, name="Bytes Name")
+        original = Foo(id=10, name="Str Name")
 
         await original.create()
 
@@ -233,4 +418,199 @@ class TestModelDecoding:
 
         assert isinstance(loaded, Foo)
         assert loaded.id == 10
-        assert loaded.name == "Bytes Name"
+        assert loaded.name == "Str Name"
+
+
+class TestModelBulk:
+    """Group bulk and pipelined Redis model tests."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_delete(self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis):
+        """Bulk create should persist every model and bulk delete should remove them."""
+
+        users = [user_class(id=idx, name=f"User {idx}") for idx in range(3)]
+
+        await user_class.bulk_create(users)
+
+        for user in users:
+            await _assert_valid_user(user, redis_mock)
+
+        await user_class.bulk_delete(users)
+
+        for user in users:
+            assert user._deleted is True
+            assert await redis_mock.get(user._redis_key) is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_ops_reject_other_model_classes(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Bulk operations should raise TypeError for instances of another model class."""
+
+        class Other(Store(FakeAsyncRedis(decode_responses=False)), RedisModel, model_name="other"):
+            id: Annotated[int, RedisPrimaryKey]
+
+        other = Other(id=1)
+
+        with pytest.raises(TypeError):
+            await user_class.bulk_create([user_class(id=1, name="Valid"), other])
+
+        with pytest.raises(TypeError):
+            await user_class.bulk_delete([other])
+
+        assert await redis_mock.keys() == []
+        assert other._deleted is False
+
+    @pytest.mark.asyncio
+    async def test_pipeline_defers_writes_until_exit(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Writes inside a pipeline context should only reach Redis when the context exits."""
+
+        stale = await _create_user(user_class, idx=1, name="Stale")
+
+        async with user_class.pipeline():
+            fresh = await _create_user(user_class, idx=2, name="Fresh")
+            await stale.delete()
+
+            assert await redis_mock.get(fresh._redis_key) is None
+            assert await redis_mock.get(stale._redis_key) is not None
+
+        await _assert_valid_user(fresh, redis_mock)
+        assert await redis_mock.get(stale._redis_key) is None
+
+    @pytest.mark.asyncio
+    async def test_pipeline_discards_writes_on_error(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Queued writes should be discarded if the pipeline context raises."""
+
+        with pytest.raises(KeyError):
+            async with user_class.pipeline():
+                await _create_user(user_class, idx=3, name="Discarded")
+
+                raise KeyError("abort")
+
+        assert await redis_mock.get(user_class._build_redis_key(3)) is None
+
+    @pytest.mark.asyncio
+    async def test_pipeline_marks_deleted_only_after_execute(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Models deleted in a pipeline stay usable if the block raises and are locked once it executes."""
+
+        single = await _create_user(user_class, idx=7, name="Single")
+        bulk = await _create_user(user_class, idx=8, name="Bulk")
+
+        with pytest.raises(KeyError):
+            async with user_class.pipeline():
+                await single.delete()
+                await user_class.bulk_delete([bulk])
+
+                raise KeyError("abort")
+
+        assert single._deleted is False
+        assert bulk._deleted is False
+
+        await single.update(name="Still Here")
+        await _assert_valid_user(single, redis_mock)
+        await _assert_valid_user(bulk, redis_mock)
+
+        async with user_class.pipeline():
+            await single.delete()
+            await user_class.bulk_delete([bulk])
+
+            assert single._deleted is False
+
+        assert single._deleted is True
+        assert bulk._deleted is True
+        assert await redis_mock.get(single._redis_key) is None
+        assert await redis_mock.get(bulk._redis_key) is None
+
+    @pytest.mark.asyncio
+    async def test_bulk_ops_join_active_pipeline(
+        self, user_class: type[UserFixture], redis_mock: FakeAsyncRedis
+    ):
+        """Bulk operations inside a pipeline should be queued and discarded if the block raises."""
+
+        stale = await _create_user(user_class, idx=4, name="Stale")
+
+        with pytest.raises(KeyError):
+            async with user_class.pipeline():
+                await user_class.bulk_create([user_class(id=5, name="Discarded")])
+                await user_class.bulk_delete([stale])
+
+                raise KeyError("abort")
+
+        assert await redis_mock.get(user_class._build_redis_key(5)) is None
+        assert await redis_mock.get(stale._redis_key) is not None
+
+        fresh = user_class(id=6, name="Fresh")
+
+        async with user_class.pipeline():
+            await user_class.bulk_create([fresh])
+
+            assert await redis_mock.get(fresh._redis_key) is None
+
+        await _assert_valid_user(fresh, redis_mock)
+
+
+class TestModelPayloadCodec:
+    """Group payload-codec Redis model tests."""
+
+    def test_unknown_payload_codec_raises(self, redis_mock: FakeAsyncRedis):
+        """An unknown payload codec should raise ValueError when the class is created."""
+
+        with pytest.raises(ValueError):
+
+            class Yaml(Store(redis_mock), RedisModel, model_name="yaml"):
+                payload_codec = "yaml"
+
+                id: Annotated[int, RedisPrimaryKey]
+
+    @pytest.mark.asyncio
+    async def test_msgpack_round_trip(self, redis_mock: FakeAsyncRedis):
+        """Models using the msgpack codec should be stored as msgpack and read back."""
+
+        ormsgpack = pytest.importorskip("ormsgpack")
+
+        class Packed(Store(redis_mock), RedisModel, model_name="packed"):
+            payload_codec = "msgpack"
+
+            id: Annotated[int, RedisPrimaryKey]
+            name: str
+
+        original = Packed(id=1, name="Packed Name")
+
+        await original.create()
+
+        assert ormsgpack.unpackb(await redis_mock.get("packed:1")) == {"id": 1, "name": "Packed Name"}
+        assert await Packed.get(1) == original
+        assert await Packed.get_many([1, 2]) == [original, None]
+
+    @pytest.mark.asyncio
+    async def test_msgpack_round_trip_strict_model(self, redis_mock: FakeAsyncRedis):
+        """Strict models with datetime, enum and tuple fields should round-trip through msgpack."""
+
+        pytest.importorskip("ormsgpack")
+
+        class Color(Enum):
+            """Color choices."""
+
+            RED = "red"
+
+        class StrictPacked(Store(redis_mock), RedisModel, model_name="strictpacked"):
+            model_config = ConfigDict(strict=True)
+            payload_codec = "msgpack"
+
+            id: Annotated[int, RedisPrimaryKey]
+            created_at: datetime
+            color: Color
+            pair: tuple[int, int]
+
+        original = StrictPacked(id=1, created_at=datetime(2024, 1, 1), color=Color.RED, pair=(1, 2))
+
+        await original.create()
+
+        assert await StrictPacked.get(1) == original
+        assert await StrictPacked.get_many([1]) == [original]
@@ -28,14 +28,14 @@ async def test_store_class_uses_bound_client_in_ops(redis_mock: FakeAsyncRedis)
     obj = Foo(id=1)
     await obj.create()
 
-    assert await redis_mock.get("foo:1") == obj.model_dump_json()
+    assert await redis_mock.get("foo:1") == obj.model_dump_json().encode()
 
 
 def test_store_multiple_clients_isolated() -> None:
     """Ensure different Store instances bind different clients without leakage."""
 
-    r1 = FakeAsyncRedis(decode_responses=True)
-    r2 = FakeAsyncRedis(decode_responses=True)
+    r1 = FakeAsyncRedis(decode_responses=False)
+    r2 = FakeAsyncRedis(decode_responses=False)
 
     class A(Store(r1), RedisModel, model_name="a"):
         id: Annotated[int, RedisPrimaryKey]
@@ -46,3 +46,10 @@ def test_store_multiple_clients_isolated() -> None:
     assert A._redis is r1
     assert B._redis is r2
     assert A._redis is not B._redis
+
+
+def test_store_reuses_base_for_same_client(redis_mock: FakeAsyncRedis) -> None:
+    """Ensure repeated Store calls with one client return the same base class."""
+
+    assert Store(redis_mock) is Store(redis_mock)
+    assert Store(redis_mock) is not Store(FakeAsyncRedis(decode_responses=False))
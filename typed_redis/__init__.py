@@ -1,2 +1,3 @@
+from .codecs import *
 from .redis import *
 from .store import *
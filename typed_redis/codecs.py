@@ -0,0 +1,22 @@
+from typing import Any, Literal
+
+__all__ = ["PayloadCodec"]
+
+
+PayloadCodec = Literal["json", "msgpack"]
+
+
+def pack_msgpack(data: Any) -> bytes:
+    """Pack data into msgpack bytes with the optional `ormsgpack` dependency."""
+
+    import ormsgpack  # pylint: disable=import-outside-toplevel
+
+    return ormsgpack.packb(data)
+
+
+def unpack_msgpack(data: bytes) -> Any:
+    """Unpack msgpack bytes with the optional `ormsgpack` dependency."""
+
+    import ormsgpack  # pylint: disable=import-outside-toplevel
+
+    return ormsgpack.unpackb(data)
@@ -1,16 +1,41 @@
 from __future__ import annotations
 
-from abc import ABC
-from typing import ClassVar, Final, Generic, TypedDict, TypeVar, cast
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from types import UnionType
+from typing import Annotated, Any, ClassVar, Final, Generic, TypedDict, TypeVar, Union, get_args, get_origin
 
+from pydantic import PrivateAttr, ValidationError
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
 from pydantic_super_model import SuperModel
+from typed_redis.codecs import PayloadCodec, pack_msgpack, unpack_msgpack
 from typed_redis.misc import ClassWithParameter
 
 __all__ = ["RedisPrimaryKey", "RedisModel"]
 
 
-REDIS_KEY_TEMPLATE: Final[str] = "{model_name}:{primary_key_value}"
+REDIS_KEY_PREFIX_TEMPLATE: Final[str] = "{model_name}:"
+
+# The pipeline opened by `RedisModel.pipeline()` in the current context, if any.
+_active_pipeline: ContextVar[Pipeline | None] = ContextVar("typed_redis_active_pipeline", default=None)
+
+# Models deleted on the active pipeline. They are marked deleted only once the pipeline executes.
+_pending_deletions: ContextVar[list[RedisModel] | None] = ContextVar(
+    "typed_redis_pending_deletions", default=None
+)
+
+
+def _make_key_builder(key_prefix: str) -> Callable[[Any], str]:
+    """Return a function that builds Redis keys under the given prefix."""
+
+    def build_redis_key(primary_key: Any) -> str:
+        """Build a Redis key from a primary key value."""
+
+        return key_prefix + str(primary_key)
+
+    return build_redis_key
 
 
 class RedisKwargs(TypedDict, total=False):
@@ -19,6 +44,7 @@ class RedisKwargs(TypedDict, total=False):
     ex: int
     px: int
     nx: bool
+    keepttl: bool
 
 
 class _RedisPrimaryKeyAnnotation:  # pylint: disable=too-few-public-methods
@@ -27,22 +53,116 @@ class _RedisPrimaryKeyAnnotation:  # pylint: disable=too-few-public-methods
 
 RedisPrimaryKey = _RedisPrimaryKeyAnnotation()
 
+
+def _is_primary_key_annotation(annotation: object) -> bool:
+    """Return whether a type hint carries `RedisPrimaryKey`, looking inside `Optional`/`Union` members."""
+
+    origin = get_origin(annotation)
+
+    if origin is Annotated:
+        inner_type, *metadata = get_args(annotation)
+
+        return any(item is RedisPrimaryKey for item in metadata) or _is_primary_key_annotation(inner_type)
+
+    if origin in (Union, UnionType):
+        return any(_is_primary_key_annotation(member) for member in get_args(annotation))
+
+    return False
+
+
 T = TypeVar("T")
 M = TypeVar("M", bound="RedisModel")
 
 
-class RedisModel(SuperModel, ClassWithParameter, ABC, Generic[T]):
+class RedisModel(SuperModel, ClassWithParameter, Generic[T]):
     """Base class for Redis-backed Pydantic models."""
 
     # Class-level Redis client. Set by the `Store` factory on the base class.
     _redis: ClassVar[Redis | None] = None
 
     # Whether the model has been deleted. No further operations are allowed if this is True.
-    _deleted: bool = False
+    _deleted: bool = PrivateAttr(default=False)
 
     # The name of the model. Passed by using the `model_name` Class argument.
     model_name: ClassVar[str | None] = None
 
+    # How the model is encoded in Redis. "msgpack" needs the `msgpack` extra and `decode_responses=False`.
+    payload_codec: ClassVar[PayloadCodec] = "json"
+
+    # pydantic-core JSON codecs, cached per class once its schema is complete.
+    _to_json_fast: ClassVar[Callable[..., bytes] | None] = None
+    _from_json_fast: ClassVar[Callable[..., Any] | None] = None
+
+    # The field annotated with `RedisPrimaryKey` and the Redis key prefix, resolved once per class.
+    _primary_key_field_name: ClassVar[str | None] = None
+    _key_prefix: ClassVar[str] = ""
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Validate the primary key and payload codec and cache the class's key prefix and JSON codecs."""
+
+        super().__pydantic_init_subclass__(**kwargs)
+
+        if cls.payload_codec not in get_args(PayloadCodec):
+            raise ValueError(f"Unknown payload codec {cls.payload_codec!r} on {cls.__name__}.")
+
+        primary_key_fields = [
+            field_name
+            for field_name, field_info in cls.model_fields.items()
+            if any(item is RedisPrimaryKey for item in field_info.metadata)
+            or _is_primary_key_annotation(field_info.annotation)
+        ]
+
+        if len(primary_key_fields) > 1:
+            raise ValueError(f"Only one primary key is allowed on {cls.__name__}.")
+
+        if not primary_key_fields and cls.model_name is not None:
+            raise ValueError(f"Primary key cannot be empty on {cls.__name__}.")
+
+        cls._primary_key_field_name = primary_key_fields[0] if primary_key_fields else None
+        cls._key_prefix = REDIS_KEY_PREFIX_TEMPLATE.format(model_name=cls.model_name)
+        cls._build_redis_key = staticmethod(_make_key_builder(cls._key_prefix))
+
+        if cls.__pydantic_complete__:
+            cls._to_json_fast = cls.__pydantic_serializer__.to_json
+            cls._from_json_fast = cls.__pydantic_validator__.validate_json
+        else:
+            cls._to_json_fast = None
+            cls._from_json_fast = None
+
+    def _dump_json(self) -> bytes:
+        """Serialize the model to JSON, skipping the `model_dump_json` wrapper."""
+
+        to_json = self._to_json_fast or self.__pydantic_serializer__.to_json
+
+        return to_json(self)
+
+    @classmethod
+    def _load_json(cls: type[M], data: str | bytes) -> M:
+        """Validate JSON into the model, skipping the `model_validate_json` wrapper."""
+
+        from_json = cls._from_json_fast or cls.__pydantic_validator__.validate_json
+
+        return from_json(data)
+
+    def _dump_payload(self) -> bytes:
+        """Serialize the model with its payload codec."""
+
+        if self.payload_codec == "msgpack":
+            return pack_msgpack(self.__pydantic_serializer__.to_python(self, mode="json"))
+
+        return self._dump_json()
+
+    @classmethod
+    def _load_payload(cls: type[M], data: str | bytes) -> M:
+        """Validate a payload stored with the model's payload codec."""
+
+        if cls.payload_codec == "msgpack":
+            # Lax mode, since the payload was dumped in JSON mode (datetimes, enums and tuples as plain values).
+            return cls.__pydantic_validator__.validate_python(unpack_msgpack(data), strict=False)
+
+        return cls._load_json(data)
+
     def _assert_not_deleted(self) -> None:
         """Assert that the model has not been deleted."""
 
@@ -51,6 +171,35 @@ class RedisModel(SuperModel, ClassWithParameter, ABC, Generic[T]):
                 f"Model {self.__class__.__name__} has been deleted. No further operations are allowed."
             )
 
+    def _assert_not_frozen(self, changes: dict[str, Any]) -> None:
+        """Assert that the changes touch neither a frozen model nor frozen fields, as pydantic's setattr does."""
+
+        if self.model_config.get("frozen"):
+            error_type = "frozen_instance"
+            frozen_changes = changes
+        else:
+            error_type = "frozen_field"
+            fields = self.__class__.model_fields
+            frozen_changes = {
+                name: value for name, value in changes.items() if getattr(fields.get(name), "frozen", False)
+            }
+
+        if frozen_changes:
+            raise ValidationError.from_exception_data(
+                self.__class__.__name__,
+                [
+                    {"type": error_type, "loc": (name,), "input": value}
+                    for name, value in frozen_changes.items()
+                ],
+            )
+
+    @classmethod
+    def _assert_own_instance(cls, instance: RedisModel) -> None:
+        """Assert that a model passed to a bulk operation is an instance of this model class."""
+
+        if not isinstance(instance, cls):
+            raise TypeError(f"{instance.__class__.__name__} instances cannot be used with {cls.__name__}.")
+
     @classmethod
     def _assert_redis_client(cls) -> None:
         """Assert that the model has a Redis client bound."""
@@ -60,52 +209,91 @@ class RedisModel(SuperModel, ClassWithParameter, ABC, Generic[T]):
                 f"No Redis client bound for {cls.__name__}. Use Store(redis_client) and inherit from the returned base."
             )
 
-    @property
-    def _primary_key_field_name(self) -> str:
-        """Return the field name annotated as the primary key."""
-
-        primary_key_fields = self.get_annotated_fields(RedisPrimaryKey)
-
-        if len(primary_key_fields) > 1:
-            raise ValueError("Only one primary key is allowed.")
-
-        if len(primary_key_fields) == 0:
-            raise ValueError("Primary key cannot be empty.")
-
-        return next(iter(primary_key_fields.keys()))
-
     @classmethod
     def _build_redis_key(cls, primary_key: T) -> str:
-        """Build a Redis key from a primary key value."""
+        """Build a Redis key from a primary key value. Subclasses get a prebuilt closure instead."""
 
-        return REDIS_KEY_TEMPLATE.format(model_name=cls.model_name, primary_key_value=primary_key)
+        return cls._key_prefix + str(primary_key)
 
     @property
     def _redis_key(self) -> str:
-        """Return this instance's Redis key."""
+        """Return this instance's Redis key, built from the current primary key value."""
 
         field_name = self._primary_key_field_name
+
+        if field_name is None:
+            raise ValueError(f"Primary key cannot be empty on {self.__class__.__name__}.")
+
         pk_value: T = getattr(self, field_name)
 
-        return REDIS_KEY_TEMPLATE.format(model_name=self.model_name, primary_key_value=pk_value)
+        return self._build_redis_key(pk_value)
 
     @property
     def _client(self) -> Redis:
         """Return the bound Redis client."""
 
-        self._assert_not_deleted()
-        self._assert_redis_client()
-
+        # Private attributes are read from `__pydantic_private__` directly on this hot path, since going
+        # through `BaseModel.__getattr__` costs an internal AttributeError on every access.
         client = self._redis
 
+        if self.__pydantic_private__["_deleted"] or client is None:
+            self._assert_not_deleted()
+            self._assert_redis_client()
+
         return client
 
+    @classmethod
+    def _get_active_pipeline(cls) -> Pipeline | None:
+        """Return the active pipeline if it was opened on this model's Redis client."""
+
+        pipe = _active_pipeline.get()
+
+        if pipe is None or pipe.connection_pool is not cls._redis.connection_pool:
+            return None
+
+        return pipe
+
+    @classmethod
+    @asynccontextmanager
+    async def pipeline(cls) -> AsyncIterator[Pipeline]:
+        """Queue model writes made inside the context and send them in a single MULTI/EXEC round-trip."""
+
+        cls._assert_redis_client()
+
+        async with cls._redis.pipeline(transaction=True) as pipe:
+            pending_deletions: list[RedisModel] = []
+            token = _active_pipeline.set(pipe)
+            pending_token = _pending_deletions.set(pending_deletions)
+
+            try:
+                yield pipe
+
+                await pipe.execute()
+            finally:
+                _active_pipeline.reset(token)
+                _pending_deletions.reset(pending_token)
+
+        for instance in pending_deletions:
+            instance._deleted = True
+
     async def _store_model_in_redis(self, **kwargs: RedisKwargs) -> None:
-        """Store the model to Redis."""
+        """Store the model to Redis, or queue it on the active pipeline."""
 
-        data = self.model_dump_json()
+        client = self._client
+        data = self._dump_payload()
+        pipe = self._get_active_pipeline()
 
-        await self._client.set(self._redis_key, data, **kwargs)
+        if pipe is not None:
+            pipe.set(self._redis_key, data, **kwargs)
+
+            return
+
+        if not kwargs:
+            await client.set(self._redis_key, data)
+
+            return
+
+        await client.set(self._redis_key, data, **kwargs)
 
     async def create(self, **kwargs: RedisKwargs) -> None:
         """Create the model in Redis. This is idempotent."""
@@ -113,22 +301,102 @@ class RedisModel(SuperModel, ClassWithParameter, ABC, Generic[T]):
         await self._store_model_in_redis(**kwargs)
 
     async def update(self, **changes: dict) -> None:
-        """Validate and persist updates into Redis."""
+        """Validate and persist updates into Redis, keeping the key's TTL."""
+
+        unknown_fields = changes.keys() - self.__class__.model_fields.keys()
+
+        if unknown_fields and self.model_config.get("extra") != "allow":
+            raise ValueError(f'"{self.__class__.__name__}" object has no fields {sorted(unknown_fields)}')
+
+        self._assert_not_frozen(changes)
 
-        self.model_validate({**self.model_dump(), **changes})
+        validated = self.__pydantic_validator__.validate_python(
+            {**self.__dict__, **(self.__pydantic_extra__ or {}), **changes}
+        )
 
-        for key, value in changes.items():
-            setattr(self, key, value)
+        # Adopt only the changed values, so validators are not re-applied to fields that did not change.
+        self.__dict__.update({name: validated.__dict__[name] for name in changes.keys() - unknown_fields})
 
-        await self._store_model_in_redis()
+        if unknown_fields:
+            self.__pydantic_extra__.update(
+                {name: validated.__pydantic_extra__[name] for name in unknown_fields}
+            )
+
+        self.__pydantic_fields_set__.update(changes)
+
+        await self._store_model_in_redis(keepttl=True)
 
     async def delete(self) -> None:
-        """Delete the model from Redis. No further operations are allowed after this is called."""
+        """Delete the model from Redis. No further operations are allowed once the delete has been sent."""
+
+        client = self._client
+        pipe = self._get_active_pipeline()
 
-        await self._client.delete(self._redis_key)
+        if pipe is not None:
+            pipe.delete(self._redis_key)
+            _pending_deletions.get().append(self)
+
+            return
+
+        await client.delete(self._redis_key)
 
         self._deleted = True
 
+    @classmethod
+    async def bulk_create(cls, instances: Iterable[M], **kwargs: RedisKwargs) -> None:
+        """Create many models in Redis in a single round-trip, or queue them on the active pipeline."""
+
+        cls._assert_redis_client()
+
+        instances = list(instances)
+
+        for instance in instances:
+            cls._assert_own_instance(instance)
+            instance._assert_not_deleted()
+
+        active_pipe = cls._get_active_pipeline()
+
+        if active_pipe is not None:
+            for instance in instances:
+                active_pipe.set(instance._redis_key, instance._dump_payload(), **kwargs)
+
+            return
+
+        async with cls._redis.pipeline(transaction=False) as pipe:
+            for instance in instances:
+                pipe.set(instance._redis_key, instance._dump_payload(), **kwargs)
+
+            await pipe.execute()
+
+    @classmethod
+    async def bulk_delete(cls, instances: Iterable[M]) -> None:
+        """Delete many models from Redis in a single round-trip, or queue it on the active pipeline."""
+
+        cls._assert_redis_client()
+
+        instances = list(instances)
+
+        for instance in instances:
+            cls._assert_own_instance(instance)
+            instance._assert_not_deleted()
+
+        if not instances:
+            return
+
+        redis_keys = [instance._redis_key for instance in instances]
+        pipe = cls._get_active_pipeline()
+
+        if pipe is not None:
+            pipe.delete(*redis_keys)
+            _pending_deletions.get().extend(instances)
+
+            return
+
+        await cls._redis.delete(*redis_keys)
+
+        for instance in instances:
+            instance._deleted = True
+
     @classmethod
     async def get(cls: type[M], primary_key: T) -> M | None:
         """Get the model from Redis and parse it into the Pydantic model."""
@@ -142,10 +410,23 @@ class RedisModel(SuperModel, ClassWithParameter, ABC, Generic[T]):
         if data is None:
             return None
 
-        if isinstance(data, bytes):
-            data = data.decode("utf-8")
+        return cls._load_payload(data)
+
+    @classmethod
+    async def get_many(cls: type[M], primary_keys: Iterable[T]) -> list[M | None]:
+        """Get many models from Redis in a single round-trip, with `None` for missing ones."""
+
+        cls._assert_redis_client()
+
+        build_redis_key = cls._build_redis_key
+        redis_keys = [build_redis_key(primary_key) for primary_key in primary_keys]
+
+        if not redis_keys:
+            return []
+
+        values = await cls._redis.mget(redis_keys)
 
-        return cast(M, cls.model_validate_json(data))
+        return [None if data is None else cls._load_payload(data) for data in values]
 
     async def __call__(self, **kwargs: RedisKwargs) -> None:
         """Initialize the model."""
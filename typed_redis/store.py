@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from weakref import WeakValueDictionary
+
 from redis.asyncio import Redis
 
 from .redis import RedisModel
@@ -7,8 +9,24 @@ from .redis import RedisModel
 __all__ = ["Store"]
 
 
+# Base classes built by `Store`, keyed by the id of their client. An entry lives only as long as its
+# base class, which holds a strong reference to the client, so ids cannot be reused while cached.
+_store_bases: WeakValueDictionary[int, type[RedisModel]] = WeakValueDictionary()
+
+
 def Store(redis_client: Redis) -> type[RedisModel]:  # pylint: disable=invalid-name
-    """Return a base model class bound to the given Redis client."""
+    """Return a base model class bound to the given Redis client, reusing it across calls."""
+
+    store_base = _store_bases.get(id(redis_client))
+
+    if store_base is None:
+        store_base = _store_bases[id(redis_client)] = _build_store_base(redis_client)
+
+    return store_base
+
+
+def _build_store_base(redis_client: Redis) -> type[RedisModel]:
+    """Build a base model class bound to the given Redis client."""
 
     class StoreBase(RedisModel):
         """Base model class bound to the provided Redis client."""